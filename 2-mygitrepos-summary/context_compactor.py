@@ -0,0 +1,335 @@
+"""
+Repository Context Compactor
+Builds a token-budgeted LLM context from a repo's README and file tree.
+
+Steps:
+  1. Strip README boilerplate (badges, HTML, license/contributing sections)
+     and drop vendored/generated paths.
+  2. Collapse runs of similar paths into a single pattern line.
+  3. Rank README sections by how informative they are.
+  4. Fill a token budget, measured with tiktoken, in order of importance.
+"""
+
+import os
+import re
+import math
+from collections import Counter, OrderedDict
+import tiktoken
+
+# About what the old fixed-size context (2000 README chars + 50 paths) cost;
+# override with REPO_CONTEXT_TOKEN_BUDGET / REPO_CONTEXT_ENCODING
+DEFAULT_TOKEN_BUDGET = 1000
+DEFAULT_ENCODING = "cl100k_base"
+
+# README sections that rarely say anything about what the project does
+BOILERPLATE_SECTIONS = {
+    "license", "licence", "contributing", "contributors", "contribution", "code of conduct",
+    "acknowledgements", "acknowledgments", "credits", "support", "sponsors", "authors",
+    "author", "contact", "table of contents", "contents", "toc", "badges", "changelog",
+    "star history", "show your support", "donate",
+}
+
+# Headings that usually carry the most useful description of a project
+INFORMATIVE_SECTIONS = {
+    "features", "overview", "about", "introduction", "description", "architecture",
+    "how it works", "tech stack", "stack", "built with", "usage", "design", "summary",
+}
+
+# Path segments for vendored, generated or dependency directories
+VENDORED_DIRS = {
+    "node_modules", "vendor", "vendors", "third_party", "thirdparty", "external", "dist",
+    "build", "out", "target", ".git", ".github", ".idea", ".vscode", "__pycache__", ".venv",
+    "venv", "env", "site-packages", ".next", ".nuxt", "coverage", ".pytest_cache", "bower_components",
+}
+
+VENDORED_FILES = {
+    "package-lock.json", "yarn.lock", "pnpm-lock.yaml", "poetry.lock", "pipfile.lock",
+    "cargo.lock", "composer.lock", "go.sum", ".ds_store",
+}
+
+BADGE_PATTERN = re.compile(r"\[!\[[^\]]*\]\([^)]*\)\]\([^)]*\)|!\[[^\]]*\]\([^)]*\)")
+HTML_COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.S)
+HTML_TAG_PATTERN = re.compile(r"</?[a-zA-Z][^>]*>")
+WORD_PATTERN = re.compile(r"[a-zA-Z][a-zA-Z0-9+#.-]*")
+
+SENTENCE_END_PATTERN = re.compile(r"[.!?][)\"']?\s")
+
+_encodings = {}
+
+
+class ApproximateEncoding:
+    """
+    Stand-in for a tiktoken encoding when the real one cannot be loaded.
+
+    Treats every 4 characters as one token, which is close enough for
+    English prose to keep contexts near their budget.
+    """
+
+    chars_per_token = 4
+
+    def encode(self, text, disallowed_special=()):
+        n = self.chars_per_token
+        return [text[i:i + n] for i in range(0, len(text), n)]
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+def get_encoding(name=DEFAULT_ENCODING):
+    """Return a cached tiktoken encoding, or an approximate one if it cannot be loaded."""
+    if name not in _encodings:
+        try:
+            _encodings[name] = tiktoken.get_encoding(name)
+        except Exception as e:
+            # tiktoken downloads encodings on first use, which fails offline
+            print(f"⚠️ Could not load tiktoken encoding '{name}' ({e}); using approximate token counts")
+            _encodings[name] = ApproximateEncoding()
+    return _encodings[name]
+
+
+def count_tokens(text, encoding=DEFAULT_ENCODING):
+    """Count tokens in text with the given tiktoken encoding."""
+    return len(get_encoding(encoding).encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text, max_tokens, encoding=DEFAULT_ENCODING):
+    """
+    Cut text down to at most max_tokens tokens.
+
+    Ends on a line break where that keeps at least half of the allowed text,
+    otherwise on a sentence end, otherwise on a word boundary, so a single
+    long paragraph is shortened rather than dropped.
+    """
+    enc = get_encoding(encoding)
+    tokens = enc.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    cut = enc.decode(tokens[:max_tokens])
+    half = len(cut) // 2
+    line_end = cut.rfind("\n")
+    sentence_ends = [m.end() for m in SENTENCE_END_PATTERN.finditer(cut)]
+    word_end = max(cut.rfind(" "), line_end)
+    if line_end >= half:
+        cut = cut[:line_end]
+    elif sentence_ends and sentence_ends[-1] >= half:
+        cut = cut[:sentence_ends[-1]]
+    elif word_end > 0:
+        cut = cut[:word_end]
+    return cut.rstrip()
+
+
+def clean_readme(readme):
+    """Remove badges, images, HTML and blank-line runs from README markdown."""
+    text = HTML_COMMENT_PATTERN.sub("", readme)
+    text = BADGE_PATTERN.sub("", text)
+    text = HTML_TAG_PATTERN.sub("", text)
+    lines = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        # Lines left with only separators or link references after stripping
+        if re.fullmatch(r"[-=*_|\s]*", stripped) and stripped:
+            continue
+        if re.fullmatch(r"\[[^\]]+\]:\s*\S+", stripped):
+            continue
+        lines.append(line.rstrip())
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def split_sections(readme):
+    """
+    Split README markdown into (heading, body) sections.
+
+    Text before the first heading becomes a section with an empty heading.
+    """
+    sections = []
+    heading, body = "", []
+    in_code = False
+    for line in readme.split("\n"):
+        if line.strip().startswith("```"):
+            in_code = not in_code
+        if not in_code and re.match(r"#{1,6}\s", line):
+            if heading or "".join(body).strip():
+                sections.append((heading, "\n".join(body).strip()))
+            heading, body = line.strip(), []
+        else:
+            body.append(line)
+    if heading or "".join(body).strip():
+        sections.append((heading, "\n".join(body).strip()))
+    return sections
+
+
+def _heading_title(heading):
+    return re.sub(r"[^a-z ]", "", heading.lstrip("#").strip().lower()).strip()
+
+
+def score_section(heading, body, position, doc_freq, num_sections):
+    """
+    Score how informative a README section is.
+
+    Rewards prose with many distinct, section-specific words (rare across the
+    README), boosts the intro and descriptive headings, and discounts
+    sections that are mostly code blocks or links.
+    """
+    lines = body.split("\n")
+    prose, code_lines, in_code = [], 0, False
+    for line in lines:
+        if line.strip().startswith("```"):
+            in_code = not in_code
+            code_lines += 1
+        elif in_code:
+            code_lines += 1
+        else:
+            prose.append(line)
+
+    words = [w.lower() for w in WORD_PATTERN.findall("\n".join(prose))]
+    if not words:
+        return 0.0
+
+    distinct = set(words)
+    rarity = sum(math.log(1 + num_sections / doc_freq[w]) for w in distinct) / len(distinct)
+    score = rarity * math.log(1 + len(distinct))
+
+    title = _heading_title(heading)
+    if position == 0:
+        score *= 2.0
+    elif any(key in title for key in INFORMATIVE_SECTIONS):
+        score *= 1.5
+    score *= 1 - 0.7 * code_lines / len(lines)
+    if body.count("](") / len(lines) > 0.5:
+        score *= 0.5
+    return score
+
+
+def rank_readme_sections(readme):
+    """
+    Clean the README, drop boilerplate sections and rank the rest.
+
+    Returns:
+        A list of (score, position, heading, body) tuples, best first
+    """
+    sections = [(h, b) for h, b in split_sections(clean_readme(readme))
+                if not any(key == _heading_title(h) or _heading_title(h).startswith(key + " ")
+                           for key in BOILERPLATE_SECTIONS)]
+    doc_freq = Counter()
+    for _, body in sections:
+        doc_freq.update(set(w.lower() for w in WORD_PATTERN.findall(body)))
+
+    ranked = [(score_section(h, b, i, doc_freq, len(sections)), i, h, b) for i, (h, b) in enumerate(sections)]
+    ranked.sort(key=lambda s: (-s[0], s[1]))
+    return ranked
+
+
+def is_vendored(path):
+    """Return True for dependency, build output and lockfile paths."""
+    parts = path.lower().split("/")
+    return parts[-1] in VENDORED_FILES or any(p in VENDORED_DIRS for p in parts[:-1]) \
+        or parts[-1].endswith((".min.js", ".min.css", ".map"))
+
+
+def compact_paths(paths, max_per_group=3):
+    """
+    Drop vendored paths and collapse repetitive ones.
+
+    Files sharing a directory and extension are listed individually up to
+    max_per_group; larger groups become a single "dir/*.ext (N files)" line.
+    """
+    groups = OrderedDict()
+    for path in paths:
+        if is_vendored(path):
+            continue
+        directory, _, name = path.rpartition("/")
+        ext = os.path.splitext(name)[1] or name
+        groups.setdefault((directory, ext), []).append(path)
+
+    lines = []
+    for (directory, ext), members in groups.items():
+        if len(members) <= max_per_group:
+            lines.extend(members)
+        else:
+            prefix = f"{directory}/" if directory else ""
+            pattern = f"*{ext}" if ext.startswith(".") else ext
+            lines.append(f"{prefix}{pattern} ({len(members)} files)")
+    return lines
+
+
+class ContextCompactor:
+    """Builds a token-budgeted repository context for the summarization model."""
+
+    def __init__(self, token_budget=None, encoding=None, readme_share=0.7):
+        # Read the environment here rather than at import, so values from .env apply
+        self.token_budget = token_budget or int(os.getenv("REPO_CONTEXT_TOKEN_BUDGET", DEFAULT_TOKEN_BUDGET))
+        self.encoding = encoding or os.getenv("REPO_CONTEXT_ENCODING", DEFAULT_ENCODING)
+        self.readme_share = readme_share
+
+    def count(self, text):
+        return count_tokens(text, self.encoding)
+
+    def compact(self, header, readme, paths):
+        """
+        Build the compacted context.
+
+        Args:
+            header: Metadata block (name, description, language, ...) that is always kept
+            readme: Raw README markdown
+            paths: All file paths in the repository
+
+        Returns:
+            A dict with the compacted "content" and "input_tokens"/"output_tokens" counts
+        """
+        raw = f"{header}\nREADME Content:\n{readme}\n\nFile Structure:\n" + "\n".join(paths)
+        input_tokens = self.count(raw)
+
+        remaining = max(0, self.token_budget - self.count(header) - 20)
+        path_lines = compact_paths(paths)
+        path_text = "\n".join(path_lines)
+        path_budget = min(self.count(path_text), int(remaining * (1 - self.readme_share)))
+        readme_budget = remaining - path_budget
+
+        # Greedily take the most informative sections, then restore README order
+        chosen = []
+        used = 0
+        for score, position, heading, body in rank_readme_sections(readme):
+            if score <= 0 or readme_budget - used < 40:
+                continue
+            block = f"{heading}\n{body}".strip()
+            cost = self.count(block) + 1
+            if used + cost > readme_budget:
+                block = truncate_to_tokens(block, readme_budget - used - 1, self.encoding)
+                if not block or block == heading:
+                    continue
+                cost = self.count(block) + 1
+            chosen.append((position, block))
+            used += cost
+        chosen.sort()
+        readme_text = "\n\n".join(block for _, block in chosen)
+
+        # Give any README budget left over to the file list
+        path_budget = remaining - self.count(readme_text)
+        path_text = truncate_to_tokens(path_text, max(0, path_budget), self.encoding)
+
+        content = f"{header}\nREADME Content:\n{readme_text}\n\nFile Structure ({len(paths)} files):\n{path_text}\n"
+        return {
+            "content": content,
+            "input_tokens": input_tokens,
+            "output_tokens": self.count(content),
+        }
+
+
+def _self_check():
+    """Regression checks for the compactor; run with `python context_compactor.py`."""
+    long_paragraph = " ".join(f"word{i % 97} does something useful." for i in range(2000))
+    readme = f"# MyProj\n\n## Features\n{long_paragraph}\n"
+    result = ContextCompactor(token_budget=800).compact("Repository: MyProj", readme, ["main.py"])
+    readme_text = result["content"].split("README Content:\n", 1)[1].split("\n\nFile Structure", 1)[0]
+    assert "## Features" in readme_text and "does something useful" in readme_text, \
+        "a single long paragraph should be shortened, not dropped"
+    assert result["output_tokens"] <= 800, result["output_tokens"]
+    assert result["output_tokens"] > 400, "most of the budget should be used"
+
+    assert truncate_to_tokens("alpha beta gamma", 100) == "alpha beta gamma"
+    assert compact_paths(["node_modules/a.js", "src/a.py"]) == ["src/a.py"]
+    print(f"✅ context_compactor checks passed ({result['output_tokens']} tokens used)")
+
+
+if __name__ == "__main__":
+    _self_check()
@@ -4,13 +4,31 @@ This agent fetches all repositories from a GitHub account and generates summarie
 """
 
 import os
-import requests
+import sys
+import base64
+import httpx
 from dotenv import load_dotenv
-from smolagents import tool, CodeAgent, HfApiModel
 
-# Load environment variables
+# Load environment variables before the local modules below read their settings
 load_dotenv()
 
+from smolagents import tool, CodeAgent, HfApiModel
+from repo_index import RepoIndex, split_summary_sections, DEFAULT_INDEX_DIR
+from context_compactor import ContextCompactor
+
+# Shared pooled HTTP client lives in ../common
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.http_client import github_client
+
+DEFAULT_MODEL_ID = "Qwen/Qwen2.5-Coder-32B-Instruct"
+
+# Local search index over repo summaries, READMEs and file paths (see repo_index.py)
+repo_index = RepoIndex(os.getenv("REPO_INDEX_DIR", DEFAULT_INDEX_DIR))
+
+# Token-budgeted README/file-tree context (budget via REPO_CONTEXT_TOKEN_BUDGET)
+compactor = ContextCompactor()
+context_token_stats = []
+
 @tool
 def get_github_repos(username: str) -> list:
     """
@@ -23,85 +41,107 @@ def get_github_repos(username: str) -> list:
         A list of repository names
     """
     try:
-        url = f"https://api.github.com/users/{username}/repos"
-        headers = {}
-        
-        # Use GitHub token if available for higher rate limits
-        github_token = os.getenv("GITHUB_TOKEN")
-        if github_token:
-            headers["Authorization"] = f"token {github_token}"
-        
-        response = requests.get(url, headers=headers)
+        # Shared client reuses its connection and sends GITHUB_TOKEN if available
+        response = github_client().get(f"/users/{username}/repos")
         response.raise_for_status()
         
         repos = response.json()
         repo_list = [{"name": repo["name"], "url": repo["html_url"], "description": repo.get("description", "No description")} for repo in repos]
         
         return repo_list
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Error occurred while fetching repositories: {e}")
         return []
 
 
-@tool
-def get_repo_content(username: str, repo_name: str) -> str:
+def fetch_repo_context(username, repo_name):
     """
-    Fetch the content of a specific repository including README and file structure.
+    Fetch a repository's metadata, README and file tree and build its compacted context.
     
     Args:
         username: The GitHub username
         repo_name: The name of the repository
         
     Returns:
-        A string containing repository information
-    """
-    try:
-        github_token = os.getenv("GITHUB_TOKEN")
-        headers = {}
-        if github_token:
-            headers["Authorization"] = f"token {github_token}"
-        
-        # Get repository details
-        repo_url = f"https://api.github.com/repos/{username}/{repo_name}"
-        repo_response = requests.get(repo_url, headers=headers)
-        repo_response.raise_for_status()
-        repo_data = repo_response.json()
-        
-        # Get README content
-        readme_url = f"https://api.github.com/repos/{username}/{repo_name}/readme"
-        readme_response = requests.get(readme_url, headers=headers)
-        readme_content = ""
-        if readme_response.status_code == 200:
-            readme_data = readme_response.json()
-            # Decode base64 content
-            import base64
-            readme_content = base64.b64decode(readme_data["content"]).decode("utf-8")
-        
-        # Get repository tree (file structure)
-        tree_url = f"https://api.github.com/repos/{username}/{repo_name}/git/trees/{repo_data['default_branch']}?recursive=1"
-        tree_response = requests.get(tree_url, headers=headers)
-        file_structure = []
-        if tree_response.status_code == 200:
-            tree_data = tree_response.json()
-            file_structure = [item["path"] for item in tree_data.get("tree", [])[:50]]  # Limit to first 50 files
+        A dict with the compacted "content", token counts, and the raw fields used by the search index
         
-        content = f"""
+    Raises:
+        httpx.HTTPError: If the repository details cannot be fetched
+    """
+    github = github_client()
+    
+    # Get repository details
+    repo_response = github.get(f"/repos/{username}/{repo_name}")
+    repo_response.raise_for_status()
+    repo_data = repo_response.json()
+    
+    # Get README content
+    readme_response = github.get(f"/repos/{username}/{repo_name}/readme")
+    readme_content = ""
+    if readme_response.status_code == 200:
+        readme_data = readme_response.json()
+        # Decode base64 content
+        readme_content = base64.b64decode(readme_data["content"]).decode("utf-8")
+    
+    # Get repository tree (file structure)
+    tree_response = github.get(f"/repos/{username}/{repo_name}/git/trees/{repo_data['default_branch']}",
+                               params={"recursive": "1"})
+    all_paths = []
+    if tree_response.status_code == 200:
+        tree_data = tree_response.json()
+        all_paths = [item["path"] for item in tree_data.get("tree", []) if item.get("type") == "blob"]
+    
+    header = f"""
 Repository: {repo_name}
 Description: {repo_data.get('description', 'No description')}
 Language: {repo_data.get('language', 'Not specified')}
 Stars: {repo_data.get('stargazers_count', 0)}
 Forks: {repo_data.get('forks_count', 0)}
+"""
+    compacted = compactor.compact(header, readme_content, all_paths)
+    return {
+        "content": compacted["content"],
+        "input_tokens": compacted["input_tokens"],
+        "output_tokens": compacted["output_tokens"],
+        "url": repo_data.get("html_url"),
+        "description": repo_data.get("description"),
+        "readme": readme_content,
+        "paths": all_paths,
+    }
 
-README Content:
-{readme_content[:2000]}  
 
-File Structure (first 50 files):
-{chr(10).join(file_structure)}
-"""
-        return content
-    except requests.exceptions.RequestException as e:
+@tool
+def get_repo_content(username: str, repo_name: str) -> str:
+    """
+    Fetch the content of a specific repository including README and file structure.
+    
+    Args:
+        username: The GitHub username
+        repo_name: The name of the repository
+        
+    Returns:
+        A string containing repository information
+    """
+    try:
+        repo = fetch_repo_context(username, repo_name)
+    except httpx.HTTPError as e:
         print(f"Error occurred while fetching repository content: {e}")
         return f"Error fetching content for {repo_name}"
+    
+    # Keep the search index in sync with what we just fetched (keyed like work_queue.py)
+    repo_index.update_repo(
+        f"{username}/{repo_name}",
+        url=repo["url"],
+        description=repo["description"],
+        readme=repo["readme"],
+        paths=repo["paths"],
+    )
+    repo_index.save()
+    
+    context_token_stats.append((repo_name, repo["input_tokens"], repo["output_tokens"]))
+    print(f"Context for {repo_name}: {repo['input_tokens']} -> {repo['output_tokens']} tokens "
+          f"(budget {compactor.token_budget})")
+    return repo["content"]
 
 
 @tool
@@ -119,9 +159,40 @@ def write_summary_to_file(content: str, filename: str = "my_github_repos_summary
     try:
         with open(filename, "w", encoding="utf-8") as f:
             f.write(content)
-        return f"Successfully wrote summary to {filename}"
     except Exception as e:
         return f"Error writing to file: {e}"
+    
+    # Attach each repo's section of the summary to its entry in the search index
+    try:
+        sections = split_summary_sections(content, repo_index.meta["rows"].keys())
+        for name, section in sections.items():
+            repo_index.update_repo(name, summary=section)
+        repo_index.save()
+    except Exception as e:
+        print(f"Error updating search index: {e}")
+        return f"Successfully wrote summary to {filename}"
+    return f"Successfully wrote summary to {filename} and indexed {len(sections)} repositories"
+
+
+def build_agent(model_id, hf_token):
+    """
+    Create the repository summary agent.
+    
+    Args:
+        model_id: Hugging Face model ID, or an inference endpoint URL (e.g. a local mock server)
+        hf_token: Hugging Face API token
+        
+    Returns:
+        A CodeAgent with the GitHub tools
+    """
+    model = HfApiModel(model_id=model_id, token=hf_token)
+    
+    # Create the agent with our custom tools
+    return CodeAgent(
+        tools=[get_github_repos, get_repo_content, write_summary_to_file],
+        model=model,
+        add_base_tools=True
+    )
 
 
 def main():
@@ -133,21 +204,14 @@ def main():
     print(f"Starting GitHub Repository Summary Agent for user: {github_username}")
     
     # Initialize the model
-    model_id = "Qwen/Qwen2.5-Coder-32B-Instruct"
+    model_id = os.getenv("HF_MODEL_ID", DEFAULT_MODEL_ID)
     hf_token = os.getenv("HF_TOKEN")
     
     if not hf_token:
         print("Warning: HF_TOKEN not found in environment variables")
         return
     
-    model = HfApiModel(model_id=model_id, token=hf_token)
-    
-    # Create the agent with our custom tools
-    agent = CodeAgent(
-        tools=[get_github_repos, get_repo_content, write_summary_to_file],
-        model=model,
-        add_base_tools=True
-    )
+    agent = build_agent(model_id, hf_token)
     
     # Run the agent with the task
     task = f"""
@@ -170,6 +234,12 @@ def main():
     print("Agent execution completed!")
     print("="*50)
     print(result)
+    
+    if context_token_stats:
+        total_in = sum(s[1] for s in context_token_stats)
+        total_out = sum(s[2] for s in context_token_stats)
+        print(f"\nRepo context tokens: {total_in} raw -> {total_out} sent "
+              f"across {len(context_token_stats)} repositories (budget {compactor.token_budget} per repo)")
 
 
 if __name__ == "__main__":
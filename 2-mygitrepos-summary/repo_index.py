@@ -0,0 +1,304 @@
+"""
+Repository Search Index
+Local TF-IDF index over repo summaries, READMEs and file paths for LLM-free querying.
+
+Terms are hashed into a fixed number of columns, so adding a repo never
+changes the layout of existing rows. Each repo owns one row of log-scaled term
+frequencies in a float32 memory map; updating a single repo only rewrites that
+row. Document frequencies are recomputed from the saved rows when the index is
+opened, so they always match them, even after a crash between an update and
+save(). IDF weights are applied at query time.
+
+Usage:
+    python repo_index.py "which of my repos use FastAPI?"
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import zlib
+import hashlib
+import argparse
+import numpy as np
+
+DEFAULT_INDEX_DIR = ".repo_index"
+DEFAULT_DIM = 2 ** 14
+INITIAL_CAPACITY = 16
+
+# How much each field contributes to a repo's term weights
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "description": 2.0,
+    "summary": 2.0,
+    "readme": 1.0,
+    "paths": 0.5,
+}
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in",
+    "is", "it", "its", "my", "of", "on", "or", "that", "the", "this", "to", "use", "uses",
+    "used", "using", "was", "which", "with", "what", "repo", "repos", "repository",
+    "repositories", "i", "me", "do", "does", "any", "all",
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric terms, dropping stopwords."""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS and len(t) > 1]
+
+
+class RepoIndex:
+    """Incrementally updatable TF-IDF index stored as NumPy memory maps."""
+
+    def __init__(self, index_dir=DEFAULT_INDEX_DIR, dim=DEFAULT_DIM):
+        self.index_dir = index_dir
+        self.docs_dir = os.path.join(index_dir, "docs")
+        self.meta_path = os.path.join(index_dir, "meta.json")
+        self.tf_path = os.path.join(index_dir, "tf.f32")
+
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                self.meta = json.load(f)
+        else:
+            self.meta = {"dim": dim, "capacity": 0, "rows": {}, "repos": {}}
+
+        self.dim = self.meta["dim"]
+        self._tf = None
+        self._df = None
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    @property
+    def tf(self):
+        """Term-frequency matrix of shape (capacity, dim), memory-mapped from disk."""
+        if self._tf is None and self.meta["capacity"]:
+            mode = "r+" if os.access(self.tf_path, os.W_OK) else "r"
+            self._tf = np.memmap(self.tf_path, dtype=np.float32, mode=mode,
+                                 shape=(self.meta["capacity"], self.dim))
+        return self._tf
+
+    @property
+    def df(self):
+        """Number of indexed repos containing each hashed term, derived from the TF rows."""
+        if self._df is None:
+            n = len(self.meta["rows"])
+            if n:
+                self._df = (np.asarray(self.tf[:n]) > 0).sum(axis=0).astype(np.int32)
+            else:
+                self._df = np.zeros(self.dim, dtype=np.int32)
+        return self._df
+
+    def _ensure_capacity(self, rows_needed):
+        capacity = self.meta["capacity"]
+        if rows_needed <= capacity:
+            return
+
+        new_capacity = max(INITIAL_CAPACITY, capacity)
+        while new_capacity < rows_needed:
+            new_capacity *= 2
+
+        # Growing the file in place keeps existing rows where they are
+        os.makedirs(self.index_dir, exist_ok=True)
+        if self._tf is not None:
+            self._tf.flush()
+            self._tf = None
+        with open(self.tf_path, "ab") as f:
+            f.truncate(new_capacity * self.dim * np.dtype(np.float32).itemsize)
+        self.meta["capacity"] = new_capacity
+
+    def save(self):
+        """Flush the memory map and write metadata to disk."""
+        os.makedirs(self.index_dir, exist_ok=True)
+        if self._tf is not None:
+            self._tf.flush()
+        tmp_path = self.meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+        os.replace(tmp_path, self.meta_path)
+
+    def _doc_path(self, repo_name):
+        return os.path.join(self.docs_dir, f"{hashlib.sha1(repo_name.encode('utf-8')).hexdigest()}.json")
+
+    def _load_doc(self, repo_name):
+        # Older indexes named docs by crc32, which can collide; only trust a doc stored under our name
+        legacy_path = os.path.join(self.docs_dir, f"{zlib.crc32(repo_name.encode('utf-8')):08x}.json")
+        for path in (self._doc_path(repo_name), legacy_path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    doc = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if doc.get("name") == repo_name:
+                return doc
+        return {"name": repo_name}
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def _vectorize(self, doc):
+        """Hash a repo document's weighted fields into a log-scaled TF row."""
+        counts = np.zeros(self.dim, dtype=np.float32)
+        for field, weight in FIELD_WEIGHTS.items():
+            value = doc.get(field)
+            if not value:
+                continue
+            if isinstance(value, list):
+                value = "\n".join(value)
+            terms = tokenize(value)
+            if not terms:
+                continue
+            buckets = np.fromiter((zlib.crc32(t.encode("utf-8")) % self.dim for t in terms),
+                                  dtype=np.int64, count=len(terms))
+            np.add.at(counts, buckets, weight)
+        nonzero = counts > 0
+        counts[nonzero] = 1.0 + np.log(counts[nonzero])
+        return counts
+
+    def update_repo(self, repo_name, **fields):
+        """
+        Add or refresh a single repo in the index.
+
+        Fields that are not passed keep their previously indexed value, so a
+        re-summarized repo only needs its new summary.
+
+        Args:
+            repo_name: The name of the repository
+            **fields: Any of url, description, summary, readme, paths
+        """
+        # Derive DF from the rows as they are now, before this repo's row changes
+        df = self.df
+        doc = self._load_doc(repo_name)
+        doc.update({k: v for k, v in fields.items() if v is not None})
+        doc["name"] = repo_name
+
+        os.makedirs(self.docs_dir, exist_ok=True)
+        with open(self._doc_path(repo_name), "w", encoding="utf-8") as f:
+            json.dump(doc, f)
+
+        row = self.meta["rows"].get(repo_name)
+        if row is None:
+            row = len(self.meta["rows"])
+            self._ensure_capacity(row + 1)
+            self.meta["rows"][repo_name] = row
+        else:
+            df[self.tf[row] > 0] -= 1
+
+        vector = self._vectorize(doc)
+        self.tf[row] = vector
+        df[vector > 0] += 1
+        self.meta["repos"][repo_name] = {"url": doc.get("url", ""), "description": doc.get("description", "")}
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def query(self, text, top_k=5):
+        """
+        Rank indexed repos against a free-text question.
+
+        Returns:
+            A list of dicts with name, url, description and score, best match first
+        """
+        rows = self.meta["rows"]
+        if not rows or not tokenize(text):
+            return []
+
+        n = len(rows)
+        idf = np.log((1.0 + n) / (1.0 + self.df)) + 1.0
+        query_vec = self._vectorize({"summary": text}) * idf
+
+        matrix = np.asarray(self.tf[:n]) * idf
+        norms = np.linalg.norm(matrix, axis=1)
+        norms[norms == 0] = 1.0
+        scores = (matrix @ query_vec) / (norms * (np.linalg.norm(query_vec) or 1.0))
+
+        names = [None] * n
+        for name, row in rows.items():
+            names[row] = name
+
+        results = []
+        for row in np.argsort(-scores)[:top_k]:
+            if scores[row] <= 0:
+                break
+            name = names[row]
+            info = self.meta["repos"].get(name, {})
+            results.append({
+                "name": name,
+                "url": info.get("url", ""),
+                "description": info.get("description", ""),
+                "score": float(scores[row]),
+            })
+        return results
+
+
+def split_summary_sections(markdown, repo_names):
+    """
+    Split a combined summary markdown into per-repo sections.
+
+    A section starts at any heading line that mentions one of the known repo
+    names and runs until the next such heading. Names of the form
+    "owner/repo" also match a heading that only mentions the bare repo name,
+    as long as no other owner has a repo of that name.
+
+    Returns:
+        A dict mapping repo name to its section text
+    """
+    lookup = {name.lower(): name for name in repo_names}
+    bare = {}
+    for name in lookup.values():
+        if "/" in name:
+            bare.setdefault(name.rsplit("/", 1)[1].lower(), []).append(name)
+    for key, names in bare.items():
+        if len(names) == 1:
+            lookup.setdefault(key, names[0])
+    sections = {}
+    current = None
+    for line in markdown.split("\n"):
+        if line.lstrip().startswith("#"):
+            heading = line.lower()
+            match = next((lookup[key] for key in sorted(lookup, key=len, reverse=True)
+                          if re.search(rf"(?<![\w-]){re.escape(key)}(?![\w-])", heading)), None)
+            if match:
+                current = match
+        if current:
+            sections.setdefault(current, []).append(line)
+    return {name: "\n".join(lines).strip() for name, lines in sections.items()}
+
+
+def main():
+    """Query the local repo index from the command line."""
+    parser = argparse.ArgumentParser(description="Search your summarized GitHub repos without an LLM")
+    parser.add_argument("query", nargs="+", help="free-text question, e.g. 'which repos use FastAPI'")
+    parser.add_argument("--top", type=int, default=5, help="number of repos to return")
+    parser.add_argument("--index-dir", default=os.getenv("REPO_INDEX_DIR", DEFAULT_INDEX_DIR))
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.index_dir, "meta.json")):
+        print(f"No index found in {args.index_dir}. Run main.py first to summarize your repos.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    index = RepoIndex(args.index_dir)
+    results = index.query(" ".join(args.query), top_k=args.top)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if not results:
+        print("No matching repositories found.")
+    for i, r in enumerate(results, 1):
+        print(f"{i}. {r['name']}  (score {r['score']:.3f})")
+        if r["url"]:
+            print(f"   {r['url']}")
+        if r["description"]:
+            print(f"   {r['description']}")
+    print(f"\n({len(index.meta['rows'])} repos searched in {elapsed_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,556 @@
+"""
+Repository Summary Work Queue
+Crash-safe, multi-process summarization of every repo in one or more GitHub accounts.
+
+Each repo moves through three tasks, stored in a local SQLite database:
+  fetch      - GitHub metadata, README and file tree -> compacted context
+  summarize  - one LLM call per repo -> markdown section
+  write      - section written to summaries/<owner>/<repo>.md
+
+Workers lease tasks, heartbeat while they work, and retry failures with
+backoff. Stage outputs are checkpointed in the database, so re-running the
+same command after a crash picks up where it left off. A final assemble step
+writes the combined markdown file and updates the search index.
+
+Usage:
+    python work_queue.py run --user tenkara --org my-org --workers 4
+    python work_queue.py status
+    python work_queue.py assemble
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import sqlite3
+import argparse
+import threading
+import multiprocessing
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Shared pooled HTTP client lives in ../common
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.http_client import github_client
+
+DEFAULT_DB_PATH = "summary_queue.db"
+DEFAULT_SUMMARIES_DIR = "summaries"
+DEFAULT_OUTPUT = "my_github_repos_summary.md"
+
+# Retry backoff: BACKOFF_BASE * 2^(attempt - 1) seconds, capped, or the server's Retry-After
+BACKOFF_BASE = 5
+MAX_BACKOFF = 900
+DEFAULT_MAX_ATTEMPTS = 8
+
+STAGES = ["fetch", "summarize", "write"]
+NEXT_STAGE = {"fetch": "summarize", "summarize": "write", "write": None}
+
+SUMMARY_PROMPT = """You are documenting a developer's GitHub repositories.
+Write a concise markdown summary of the repository below. Start with a level-2
+heading of the form "## [<repo name>](<repo url>)" and then cover:
+- Description
+- Main programming language
+- Key features based on README
+- File structure overview
+Return only the markdown."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner         TEXT NOT NULL,
+    repo          TEXT NOT NULL,
+    stage         TEXT NOT NULL,
+    status        TEXT NOT NULL DEFAULT 'pending',
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    available_at  REAL NOT NULL DEFAULT 0,
+    lease_owner   TEXT,
+    lease_expires REAL,
+    error         TEXT,
+    updated_at    REAL NOT NULL,
+    UNIQUE (owner, repo, stage)
+);
+CREATE INDEX IF NOT EXISTS tasks_claim ON tasks (status, available_at);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    owner   TEXT NOT NULL,
+    repo    TEXT NOT NULL,
+    stage   TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (owner, repo, stage)
+);
+"""
+
+
+class WorkQueue:
+    """SQLite-backed task queue with leases, retries and per-stage checkpoints."""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, lease_seconds=120, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        # Autocommit mode; multi-statement updates use explicit BEGIN IMMEDIATE
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _transaction(self):
+        return _Transaction(self.conn)
+
+    def enqueue(self, owner, repo):
+        """Add the first task for a repo; repos already queued are left untouched."""
+        self.conn.execute(
+            "INSERT OR IGNORE INTO tasks (owner, repo, stage, updated_at) VALUES (?, ?, ?, ?)",
+            (owner, repo, STAGES[0], time.time()),
+        )
+
+    def claim(self, worker_id):
+        """
+        Lease the next runnable task.
+
+        A task is runnable when it is pending and its backoff has elapsed, or
+        when it is leased but the lease expired (its worker died).
+
+        Returns:
+            The task row, or None if nothing is runnable right now
+        """
+        now = time.time()
+        with self._transaction():
+            while True:
+                row = self.conn.execute(
+                    """SELECT * FROM tasks
+                       WHERE (status = 'pending' AND available_at <= ?)
+                          OR (status = 'leased' AND lease_expires < ?)
+                       ORDER BY id LIMIT 1""",
+                    (now, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                if row["status"] == "pending" or row["attempts"] < self.max_attempts:
+                    break
+                # The task keeps taking its worker down with it; stop retrying
+                self.conn.execute(
+                    """UPDATE tasks SET status = 'failed', lease_owner = NULL, lease_expires = NULL,
+                              error = 'lease expired too many times', updated_at = ? WHERE id = ?""",
+                    (now, row["id"]),
+                )
+            self.conn.execute(
+                """UPDATE tasks SET status = 'leased', lease_owner = ?, lease_expires = ?,
+                          attempts = attempts + 1, updated_at = ? WHERE id = ?""",
+                (worker_id, now + self.lease_seconds, now, row["id"]),
+            )
+        return self.conn.execute("SELECT * FROM tasks WHERE id = ?", (row["id"],)).fetchone()
+
+    def heartbeat(self, task_id, worker_id):
+        """Extend a lease; returns False if the lease was lost to another worker."""
+        cur = self.conn.execute(
+            "UPDATE tasks SET lease_expires = ? WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+            (time.time() + self.lease_seconds, task_id, worker_id),
+        )
+        return cur.rowcount == 1
+
+    def complete(self, task, worker_id, payload):
+        """Checkpoint a stage's output, mark it done and queue the next stage atomically."""
+        now = time.time()
+        with self._transaction():
+            cur = self.conn.execute(
+                """UPDATE tasks SET status = 'done', lease_owner = NULL, lease_expires = NULL,
+                          error = NULL, updated_at = ?
+                   WHERE id = ? AND status = 'leased' AND lease_owner = ?""",
+                (now, task["id"], worker_id),
+            )
+            if cur.rowcount != 1:
+                # Lease expired and another worker took over; drop this result
+                return False
+            self.conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (owner, repo, stage, payload) VALUES (?, ?, ?, ?)",
+                (task["owner"], task["repo"], task["stage"], json.dumps(payload)),
+            )
+            next_stage = NEXT_STAGE[task["stage"]]
+            if next_stage:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO tasks (owner, repo, stage, updated_at) VALUES (?, ?, ?, ?)",
+                    (task["owner"], task["repo"], next_stage, now),
+                )
+        return True
+
+    def fail(self, task, worker_id, error, retry_after=None, retryable=True):
+        """
+        Requeue a failed task with exponential backoff, or mark it failed for good.
+
+        Args:
+            task: The leased task row
+            worker_id: The worker holding the lease
+            error: The exception or message to record
+            retry_after: Seconds the server asked us to wait (Retry-After), if any
+            retryable: False for errors that cannot succeed on retry (e.g. a 404)
+        """
+        now = time.time()
+        if not retryable or task["attempts"] >= self.max_attempts:
+            status, available_at = "failed", now
+        else:
+            delay = min(MAX_BACKOFF, BACKOFF_BASE * 2 ** (task["attempts"] - 1))
+            if retry_after is not None:
+                delay = max(delay, min(MAX_BACKOFF, retry_after))
+            # Jitter so workers that failed together do not retry together
+            status, available_at = "pending", now + delay * random.uniform(1.0, 1.25)
+        self.conn.execute(
+            """UPDATE tasks SET status = ?, available_at = ?, lease_owner = NULL, lease_expires = NULL,
+                      error = ?, updated_at = ?
+               WHERE id = ? AND lease_owner = ?""",
+            (status, available_at, str(error)[:1000], now, task["id"], worker_id),
+        )
+
+    def retry_failed(self):
+        """
+        Move permanently failed tasks back to pending with a fresh attempt count.
+
+        Returns:
+            The number of tasks requeued
+        """
+        cur = self.conn.execute(
+            """UPDATE tasks SET status = 'pending', attempts = 0, available_at = 0, updated_at = ?
+               WHERE status = 'failed'""",
+            (time.time(),),
+        )
+        return cur.rowcount
+
+    def checkpoint(self, owner, repo, stage):
+        """Return the saved output of a completed stage, or None."""
+        row = self.conn.execute(
+            "SELECT payload FROM checkpoints WHERE owner = ? AND repo = ? AND stage = ?",
+            (owner, repo, stage),
+        ).fetchone()
+        return json.loads(row["payload"]) if row else None
+
+    def has_open_tasks(self):
+        """True while any task is pending or leased."""
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE status IN ('pending', 'leased')"
+        ).fetchone()
+        return row[0] > 0
+
+    def counts(self):
+        """Task counts by stage and status."""
+        rows = self.conn.execute(
+            "SELECT stage, status, COUNT(*) AS n FROM tasks GROUP BY stage, status"
+        ).fetchall()
+        counts = {stage: {} for stage in STAGES}
+        for row in rows:
+            counts[row["stage"]][row["status"]] = row["n"]
+        return counts
+
+    def failures(self):
+        return self.conn.execute(
+            "SELECT owner, repo, stage, attempts, error FROM tasks WHERE status = 'failed' ORDER BY owner, repo"
+        ).fetchall()
+
+    def written_repos(self):
+        """(owner, repo) pairs whose write stage is done, in a stable order."""
+        return [(r["owner"], r["repo"]) for r in self.conn.execute(
+            "SELECT owner, repo FROM tasks WHERE stage = 'write' AND status = 'done' ORDER BY owner, repo"
+        )]
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK so claims are serialized across processes."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+# ----------------------------------------------------------------------
+# Listing repositories
+# ----------------------------------------------------------------------
+
+def list_account_repos(account, is_org=False):
+    """
+    List every repository of a GitHub user or organization, following pagination.
+
+    Returns:
+        A list of (owner, repo_name) tuples
+    """
+    kind = "orgs" if is_org else "users"
+    url = f"/{kind}/{account}/repos"
+    params = {"per_page": 100, "type": "all" if is_org else "owner"}
+    repos = []
+    while url:
+        response = github_client().get(url, params=params)
+        response.raise_for_status()
+        repos.extend((r["owner"]["login"], r["name"]) for r in response.json())
+        url = response.links.get("next", {}).get("url")
+        params = None
+    return repos
+
+
+class TransientError(Exception):
+    """A stage failure worth retrying that is not an HTTP or network error."""
+
+
+def is_retryable(error):
+    """
+    Decide whether a stage failure can succeed on a later attempt.
+
+    Network errors, timeouts, 429s, 5xx responses and GitHub rate-limit 403s
+    are retried; anything else (404, 401, bad data, bugs) fails at once.
+    """
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is not None:
+        if status == 429 or status >= 500:
+            return True
+        headers = getattr(response, "headers", {})
+        return status == 403 and (headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in headers)
+    # httpx transport errors, and requests/huggingface_hub connection errors (OSError subclasses)
+    return isinstance(error, (TransientError, httpx.TransportError, OSError)) \
+        and not isinstance(error, (FileNotFoundError, PermissionError))
+
+
+def retry_after_seconds(error):
+    """
+    Read a Retry-After header from an HTTP error, if it carries a response.
+
+    Works for httpx and requests/huggingface_hub errors alike.
+
+    Returns:
+        The delay in seconds, or None
+    """
+    response = getattr(error, "response", None)
+    value = getattr(response, "headers", {}).get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# ----------------------------------------------------------------------
+# Stage handlers
+# ----------------------------------------------------------------------
+
+class StageRunner:
+    """Runs one task stage; created once per worker process."""
+
+    def __init__(self, queue, summaries_dir):
+        # Imported here so each worker process loads the agent module itself
+        from main import fetch_repo_context, DEFAULT_MODEL_ID
+        from smolagents import HfApiModel
+
+        self.queue = queue
+        self.summaries_dir = summaries_dir
+        self.fetch_repo_context = fetch_repo_context
+        self.model = HfApiModel(model_id=os.getenv("HF_MODEL_ID", DEFAULT_MODEL_ID), token=os.getenv("HF_TOKEN"))
+
+    def run(self, task):
+        handler = getattr(self, f"_{task['stage']}")
+        return handler(task["owner"], task["repo"])
+
+    def _fetch(self, owner, repo):
+        return self.fetch_repo_context(owner, repo)
+
+    def _summarize(self, owner, repo):
+        fetched = self.queue.checkpoint(owner, repo, "fetch")
+        messages = [
+            {"role": "system", "content": [{"type": "text", "text": SUMMARY_PROMPT}]},
+            {"role": "user", "content": [{"type": "text", "text": f"URL: {fetched['url']}\n{fetched['content']}"}]},
+        ]
+        response = self.model(messages)
+        summary = getattr(response, "content", response)
+        if not summary or not summary.strip():
+            raise TransientError("Model returned an empty summary")
+        return {"summary": summary.strip()}
+
+    def _write(self, owner, repo):
+        summary = self.queue.checkpoint(owner, repo, "summarize")["summary"]
+        # Absolute, so assemble works from any directory
+        path = os.path.abspath(os.path.join(self.summaries_dir, owner, f"{repo}.md"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(summary + "\n")
+        os.replace(tmp_path, path)
+        return {"path": path}
+
+
+def worker_main(worker_num, db_path, summaries_dir, lease_seconds, max_attempts):
+    """Worker process loop: claim, run with heartbeats, complete or fail, until the queue drains."""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{worker_num}"
+    queue = WorkQueue(db_path, lease_seconds=lease_seconds, max_attempts=max_attempts)
+    runner = StageRunner(queue, summaries_dir)
+
+    while True:
+        task = queue.claim(worker_id)
+        if task is None:
+            if not queue.has_open_tasks():
+                break
+            # Other workers hold leases or tasks are backing off
+            time.sleep(1)
+            continue
+
+        label = f"{task['owner']}/{task['repo']} [{task['stage']}]"
+        stop = threading.Event()
+        beat_queue = WorkQueue(db_path, lease_seconds=lease_seconds)
+
+        def beat():
+            while not stop.wait(lease_seconds / 3):
+                beat_queue.heartbeat(task["id"], worker_id)
+
+        heartbeat = threading.Thread(target=beat, daemon=True)
+        heartbeat.start()
+        try:
+            payload = runner.run(task)
+        except Exception as e:
+            stop.set()
+            heartbeat.join()
+            retryable = is_retryable(e)
+            queue.fail(task, worker_id, e, retry_after_seconds(e), retryable)
+            reason = "" if retryable else " (not retryable)"
+            print(f"⚠️ [worker {worker_num}] {label} attempt {task['attempts']} failed{reason}: {e}")
+        else:
+            stop.set()
+            heartbeat.join()
+            if queue.complete(task, worker_id, payload):
+                print(f"✅ [worker {worker_num}] {label}")
+        finally:
+            beat_queue.close()
+
+    queue.close()
+
+
+# ----------------------------------------------------------------------
+# Assemble
+# ----------------------------------------------------------------------
+
+def assemble(queue, output=DEFAULT_OUTPUT):
+    """Write the combined markdown and refresh the search index from checkpoints."""
+    from main import repo_index
+
+    sections = []
+    for owner, repo in queue.written_repos():
+        path = queue.checkpoint(owner, repo, "write")["path"]
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                summary = f.read().strip()
+        except OSError as e:
+            print(f"⚠️ Skipping {owner}/{repo}: cannot read its summary ({e})")
+            continue
+        sections.append(summary)
+
+        fetched = queue.checkpoint(owner, repo, "fetch")
+        # Keyed by owner/repo: repos with the same name can come from different accounts
+        repo_index.update_repo(
+            f"{owner}/{repo}",
+            url=fetched["url"],
+            description=fetched["description"],
+            readme=fetched["readme"],
+            paths=fetched["paths"],
+            summary=summary,
+        )
+    repo_index.save()
+
+    header = (f"# GitHub Repository Summaries\n\n"
+              f"_Generated {datetime.now().strftime('%Y-%m-%d %H:%M')} — {len(sections)} repositories_\n")
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(header + "\n" + "\n\n".join(sections) + "\n")
+    print(f"📝 Wrote {len(sections)} repository summaries to {output}")
+
+    failures = queue.failures()
+    if failures:
+        print(f"⚠️ {len(failures)} repositories failed permanently:")
+        for row in failures:
+            print(f"   • {row['owner']}/{row['repo']} [{row['stage']}] after {row['attempts']} attempts: {row['error']}")
+
+
+def print_status(queue):
+    print(f"{'stage':<10} {'pending':>8} {'leased':>8} {'done':>8} {'failed':>8}")
+    print("-" * 46)
+    for stage, counts in queue.counts().items():
+        print(f"{stage:<10} {counts.get('pending', 0):>8} {counts.get('leased', 0):>8} "
+              f"{counts.get('done', 0):>8} {counts.get('failed', 0):>8}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Crash-safe multi-process GitHub repo summarizer")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite queue database")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="queue repos, process them with worker processes, then assemble")
+    run.add_argument("--user", action="append", default=[], help="GitHub user to summarize (repeatable)")
+    run.add_argument("--org", action="append", default=[], help="GitHub organization to summarize (repeatable)")
+    run.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    run.add_argument("--lease-seconds", type=int, default=120)
+    run.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+    run.add_argument("--summaries-dir", default=DEFAULT_SUMMARIES_DIR)
+    run.add_argument("--output", default=DEFAULT_OUTPUT)
+    run.add_argument("--retry-failed", action="store_true",
+                     help="give tasks that failed permanently in an earlier run another try")
+
+    sub.add_parser("status", help="show task counts")
+
+    asm = sub.add_parser("assemble", help="write the combined markdown from finished repos")
+    asm.add_argument("--output", default=DEFAULT_OUTPUT)
+
+    args = parser.parse_args()
+    queue = WorkQueue(args.db)
+
+    if args.command == "status":
+        print_status(queue)
+    elif args.command == "assemble":
+        assemble(queue, args.output)
+    else:
+        users = args.user or ([os.getenv("GITHUB_USERNAME")] if os.getenv("GITHUB_USERNAME") else [])
+        accounts = [(u, False) for u in users] + [(o, True) for o in args.org]
+        for account, is_org in accounts:
+            repos = list_account_repos(account, is_org)
+            for owner, repo in repos:
+                queue.enqueue(owner, repo)
+            print(f"📦 Queued {len(repos)} repositories from {account}")
+
+        if args.retry_failed:
+            print(f"🔁 Requeued {queue.retry_failed()} failed tasks from earlier runs")
+
+        print_status(queue)
+        workers = [
+            multiprocessing.Process(
+                target=worker_main,
+                args=(i, args.db, args.summaries_dir, args.lease_seconds, args.max_attempts),
+            )
+            for i in range(args.workers)
+        ]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        print()
+        print_status(queue)
+        assemble(queue, args.output)
+
+    queue.close()
+
+
+if __name__ == "__main__":
+    main()
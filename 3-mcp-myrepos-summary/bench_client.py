@@ -0,0 +1,150 @@
+"""
+MCP Server Latency Benchmark
+Local test client that compares cold-start and warm-cache latency of server.py.
+
+Phases:
+  1. cold  - fresh server process with an empty cache directory
+  2. warm  - same process, served from the in-memory cache
+  3. disk  - restarted server process reusing the on-disk cache
+  4. concurrent - several analyze_repo calls in flight at once on the warm server
+"""
+
+import os
+import sys
+import time
+import json
+import shutil
+import argparse
+import tempfile
+import statistics
+import anyio
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+
+
+def server_params(cache_dir):
+    """Build stdio launch parameters for server.py using the given cache directory."""
+    env = dict(os.environ, GITHUB_CACHE_DIR=cache_dir)
+    return StdioServerParameters(command=sys.executable, args=[SERVER_PATH], env=env)
+
+
+async def timed_call(session, tool, arguments=None):
+    """Call a tool and return (elapsed_ms, result)."""
+    start = time.perf_counter()
+    result = await session.call_tool(tool, arguments or {})
+    elapsed = (time.perf_counter() - start) * 1000
+    if result.isError:
+        raise RuntimeError(f"{tool} failed: {result.content}")
+    return elapsed, result
+
+
+def parse_json_items(result):
+    """Decode a tool result into a list of JSON items.
+
+    Depending on the MCP SDK version a list return value arrives either as one
+    text item per element or as a single JSON array.
+    """
+    items = [json.loads(c.text) for c in result.content if getattr(c, "text", None)]
+    if len(items) == 1 and isinstance(items[0], list):
+        return items[0]
+    return items
+
+
+async def run_workload(session, repos):
+    """Run list_repos plus analyze_repo for each repo, returning per-call timings."""
+    timings = {}
+    timings["list_repos"], _ = await timed_call(session, "list_repos")
+    for owner, name in repos:
+        timings[f"analyze_repo {name}"], _ = await timed_call(session, "analyze_repo", {"owner": owner, "repo": name})
+    return timings
+
+
+async def run_concurrent(session, repos, copies):
+    """Fire analyze_repo for every repo `copies` times at once and return wall time in ms."""
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for _ in range(copies):
+            for owner, name in repos:
+                tg.start_soon(timed_call, session, "analyze_repo", {"owner": owner, "repo": name})
+    return (time.perf_counter() - start) * 1000
+
+
+def print_phase(title, timings):
+    print(f"\n{title}")
+    print("-" * 60)
+    for name, ms in timings.items():
+        print(f"   {name:<40} {ms:>10.1f} ms")
+
+
+async def benchmark(num_repos, warm_rounds, concurrency):
+    cache_dir = tempfile.mkdtemp(prefix="mcp-github-cache-")
+    try:
+        # 1. Cold start: new process, empty caches
+        start = time.perf_counter()
+        async with stdio_client(server_params(cache_dir)) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                startup_ms = (time.perf_counter() - start) * 1000
+
+                list_ms, result = await timed_call(session, "list_repos")
+                repos = [(r["owner"], r["name"]) for r in parse_json_items(result)[:num_repos]]
+                if not repos:
+                    print("❌ No repositories found for this token.")
+                    return
+
+                cold = await run_workload(session, repos)
+                cold["list_repos"] = list_ms
+                cold["server startup"] = startup_ms
+                print_phase("🧊 Cold start (empty cache)", cold)
+
+                # 2. Warm: same process, in-memory cache
+                rounds = [await run_workload(session, repos) for _ in range(warm_rounds)]
+                warm = {name: statistics.median(r[name] for r in rounds) for name in rounds[0]}
+                print_phase(f"🔥 Warm cache (median of {warm_rounds} rounds)", warm)
+
+                # 4. Concurrent calls against the warm server
+                wall_ms = await run_concurrent(session, repos, concurrency)
+                calls = len(repos) * concurrency
+                print_phase(f"⚡ Concurrent analyze_repo ({calls} calls in flight)", {
+                    "total wall time": wall_ms,
+                    "per call (amortized)": wall_ms / calls,
+                })
+
+                _, result = await timed_call(session, "cache_stats")
+                stats = parse_json_items(result)[0]
+
+        # 3. Restarted process, warm disk cache
+        start = time.perf_counter()
+        async with stdio_client(server_params(cache_dir)) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                restart_ms = (time.perf_counter() - start) * 1000
+                disk = await run_workload(session, repos)
+                disk["server startup"] = restart_ms
+        print_phase("💾 Restarted server (disk cache)", disk)
+
+        print("\n" + "=" * 60)
+        print(f"📊 Cache stats (first process): {stats}")
+        cold_total = sum(v for k, v in cold.items() if k != "server startup")
+        warm_total = sum(warm.values())
+        print(f"🚀 Warm vs cold workload: {warm_total:.1f} ms vs {cold_total:.1f} ms "
+              f"({cold_total / max(warm_total, 1e-6):.1f}x faster)")
+        print("=" * 60)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Measure cold vs warm latency of the GitHub repos MCP server")
+    parser.add_argument("--repos", type=int, default=3, help="number of repositories to analyze")
+    parser.add_argument("--warm-rounds", type=int, default=5, help="warm-cache rounds to take the median over")
+    parser.add_argument("--concurrency", type=int, default=4, help="copies of each analyze_repo call to run at once")
+    args = parser.parse_args()
+    anyio.run(benchmark, args.repos, args.warm_rounds, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+GitHub API Client
+Pooled, cached GitHub REST API client shared by the notebook and the MCP server.
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Shared pooled HTTP client lives in ../common
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.http_client import get_http_client
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "github")
+
+
+def get_token():
+    """Get GitHub token from environment."""
+    return os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+
+
+class GitHubClient:
+    """GitHub API client - connects to the remote GitHub API.
+
+    Requests go through the repository's shared ``httpx`` client, which keeps
+    connections to api.github.com alive between calls. Successful responses
+    are kept in an in-memory cache backed by a JSON file cache on disk, keyed
+    per token. Entries older than ``cache_ttl`` are revalidated with their
+    ETag, so unchanged resources come back as a 304 which does not count
+    against the GitHub rate limit.
+
+    The in-memory layer is an LRU bounded by ``max_memory_entries`` and
+    ``max_memory_bytes``; evicted entries are still served from disk. Disk
+    entries not refreshed for ``disk_max_age`` seconds are deleted when the
+    client starts.
+    """
+
+    def __init__(self, token, cache_dir=DEFAULT_CACHE_DIR, cache_ttl=300, timeout=None,
+                 max_memory_entries=512, max_memory_bytes=64 * 1024 * 1024, disk_max_age=7 * 86400):
+        self.token = token
+        self.base = "https://api.github.com"
+        self.headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "github-repos-summarizer",
+            "X-GitHub-Api-Version": "2022-11-28"
+        }
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_max_age = disk_max_age
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "revalidated": 0, "fetched": 0, "evicted": 0}
+
+        # Responses such as /user/repos depend on who is authenticated, so the
+        # token hash scopes both the pooled client and the cache keys
+        self.token_hash = hashlib.sha1((self.token or "").encode("utf-8")).hexdigest()[:12]
+        self.http = get_http_client(f"github-{self.token_hash}", headers=self.headers, timeout=timeout)
+
+        # key -> (entry, size in bytes of its JSON form), least recently used first
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.prune_disk_cache()
+
+    def _cache_key(self, url, params):
+        raw = self.token_hash + " " + url + "?" + json.dumps(params or {}, sort_keys=True)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _remember(self, key, entry, size):
+        """Put an entry in the in-memory LRU, evicting the oldest ones over the limits."""
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= old[1]
+            self._memory[key] = (entry, size)
+            self._memory_bytes += size
+            while len(self._memory) > 1 and (len(self._memory) > self.max_memory_entries
+                                             or self._memory_bytes > self.max_memory_bytes):
+                _, (_, evicted_size) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted_size
+                self.stats["evicted"] += 1
+
+    def _load_entry(self, key):
+        """Look up a cached response, first in memory and then on disk."""
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+        if cached is not None or not self.cache_dir:
+            return (cached[0] if cached else None), "memory"
+
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = f.read()
+            entry = json.loads(raw)
+        except (OSError, ValueError):
+            return None, None
+        self._remember(key, entry, len(raw))
+        return entry, "disk"
+
+    def _store_entry(self, key, entry):
+        raw = json.dumps(entry)
+        self._remember(key, entry, len(raw))
+        if not self.cache_dir:
+            return
+
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(raw)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def prune_disk_cache(self, max_age=None):
+        """
+        Delete disk cache files not written for max_age seconds (default ``disk_max_age``).
+
+        Every fetch or revalidation rewrites an entry's file, so only entries
+        nobody has refreshed in that time are removed.
+
+        Returns:
+            The number of files deleted
+        """
+        if not self.cache_dir:
+            return 0
+        cutoff = time.time() - (self.disk_max_age if max_age is None else max_age)
+        removed = 0
+        try:
+            files = list(os.scandir(self.cache_dir))
+        except OSError:
+            return 0
+        for item in files:
+            # Leftover .tmp files come from writers that died mid-write
+            if not item.name.endswith((".json", ".tmp")):
+                continue
+            try:
+                if item.stat().st_mtime < cutoff:
+                    os.remove(item.path)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def memory_usage(self):
+        """Number of entries and bytes held by the in-memory cache."""
+        with self._lock:
+            return {"memory_entries": len(self._memory), "memory_bytes": self._memory_bytes}
+
+    def _count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _get(self, url, params=None, allow_404=True):
+        """
+        GET a JSON resource through the cache.
+
+        Args:
+            url: Full API URL
+            params: Optional query parameters
+            allow_404: Return a 404 status instead of raising ``httpx.HTTPStatusError``
+
+        Returns:
+            Tuple of (status_code, data, link_header). Only 200 responses are cached.
+        """
+        key = self._cache_key(url, params)
+        entry, source = self._load_entry(key)
+
+        if entry is not None and time.time() - entry["stored_at"] < self.cache_ttl:
+            self._count("memory_hits" if source == "memory" else "disk_hits")
+            return 200, entry["data"], entry["link"]
+
+        headers = {}
+        if entry is not None and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+
+        resp = self.http.get(url, params=params, headers=headers)
+        if resp.status_code == 304 and entry is not None:
+            self._count("revalidated")
+            entry = dict(entry, stored_at=time.time())
+            self._store_entry(key, entry)
+            return 200, entry["data"], entry["link"]
+
+        self._count("fetched")
+        if resp.status_code == 401:
+            raise Exception("❌ Unauthorized: Check your GH_TOKEN")
+        if resp.status_code == 404 and allow_404:
+            return 404, None, ""
+        resp.raise_for_status()
+
+        entry = {
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "link": resp.headers.get("Link", ""),
+            "stored_at": time.time(),
+            "data": resp.json(),
+        }
+        self._store_entry(key, entry)
+        return 200, entry["data"], entry["link"]
+
+    def clear_memory_cache(self):
+        """Drop in-memory entries; the disk cache is kept."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def list_user_repos(self, per_page=100):
+        """List all repositories for the authenticated user."""
+        url = f"{self.base}/user/repos"
+        params = {"per_page": per_page, "sort": "updated", "direction": "desc"}
+        repos = []
+
+        while url:
+            _, data, link = self._get(url, params)
+            repos.extend(data)
+
+            url = None
+            for part in link.split(","):
+                if 'rel="next"' in part:
+                    url = part.split(";")[0].strip().strip("<>")
+                    break
+            params = None
+        return repos
+
+    def get_repo_details(self, owner, repo):
+        """Get detailed repository information."""
+        url = f"{self.base}/repos/{owner}/{repo}"
+        _, data, _ = self._get(url, allow_404=False)
+        return data
+
+    def get_repo_contents(self, owner, repo, path=""):
+        """Get contents of a repository path."""
+        url = f"{self.base}/repos/{owner}/{repo}/contents/{path}"
+        status, data, _ = self._get(url)
+        if status == 404:
+            return []
+        return data
+
+    def get_file_content(self, owner, repo, path):
+        """Get decoded content of a specific file."""
+        url = f"{self.base}/repos/{owner}/{repo}/contents/{path}"
+        status, data, _ = self._get(url)
+        if status == 404:
+            return None
+        if data.get("encoding") == "base64":
+            return base64.b64decode(data["content"]).decode("utf-8", errors="ignore")
+        return data.get("content", "")
+
+    def get_repo_languages(self, owner, repo):
+        """Get languages used in the repository."""
+        url = f"{self.base}/repos/{owner}/{repo}/languages"
+        _, data, _ = self._get(url, allow_404=False)
+        return data
+
+    def get_repo_tree(self, owner, repo, sha="HEAD", recursive=True):
+        """Get the full file tree of a repository."""
+        url = f"{self.base}/repos/{owner}/{repo}/git/trees/{sha}"
+        params = {"recursive": "1"} if recursive else {}
+        status, data, _ = self._get(url, params)
+        if status == 404:
+            return {"tree": []}
+        return data
@@ -0,0 +1,144 @@
+"""
+GitHub Repos MCP Server
+Long-lived MCP stdio server exposing GitHubClient and RepoAnalyzer as tools.
+
+The GitHub client (connection pool plus memory/disk caches) is created once
+when the process starts and shared by every tool call, so repeated calls
+from an MCP host are served warm instead of rebuilding state per session.
+"""
+
+import os
+import sys
+import anyio
+from dotenv import load_dotenv
+from mcp.server.fastmcp import FastMCP
+
+from github_client import GitHubClient, get_token, DEFAULT_CACHE_DIR
+from repo_analyzer import RepoAnalyzer
+
+# Load environment variables from .env file in parent directory
+load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+
+mcp = FastMCP("github-repos")
+
+_github = None
+
+
+def get_github():
+    """Return the process-wide GitHub client, creating it on first use."""
+    global _github
+    if _github is None:
+        token = get_token()
+        if not token:
+            raise RuntimeError("No GitHub token found! Set GH_TOKEN in .env file.")
+        _github = GitHubClient(
+            token,
+            cache_dir=os.getenv("GITHUB_CACHE_DIR", DEFAULT_CACHE_DIR),
+            cache_ttl=int(os.getenv("GITHUB_CACHE_TTL", "300")),
+            max_memory_bytes=int(float(os.getenv("GITHUB_MEMORY_CACHE_MB", "64")) * 1024 * 1024),
+            disk_max_age=int(float(os.getenv("GITHUB_CACHE_MAX_AGE_DAYS", "7")) * 86400),
+        )
+    return _github
+
+
+async def _run_blocking(func, *args):
+    """Run a blocking GitHub call in a worker thread so tool calls overlap."""
+    return await anyio.to_thread.run_sync(func, *args)
+
+
+@mcp.tool()
+async def list_repos() -> list:
+    """List all repositories for the authenticated user with basic metadata."""
+    repos = await _run_blocking(get_github().list_user_repos)
+    return [
+        {
+            "name": r.get("name"),
+            "owner": r.get("owner", {}).get("login"),
+            "description": r.get("description"),
+            "language": r.get("language"),
+            "stars": r.get("stargazers_count", 0),
+            "updated_at": r.get("updated_at"),
+            "url": r.get("html_url"),
+        }
+        for r in repos
+    ]
+
+
+@mcp.tool()
+async def repo_details(owner: str, repo: str) -> dict:
+    """
+    Get detailed repository information.
+
+    Args:
+        owner: The repository owner (user or organization)
+        repo: The repository name
+    """
+    return await _run_blocking(get_github().get_repo_details, owner, repo)
+
+
+@mcp.tool()
+async def repo_tree(owner: str, repo: str) -> list:
+    """
+    Get the full file tree of a repository as a list of file paths.
+
+    Args:
+        owner: The repository owner (user or organization)
+        repo: The repository name
+    """
+    tree = await _run_blocking(get_github().get_repo_tree, owner, repo)
+    return [f["path"] for f in tree.get("tree", []) if f.get("type") == "blob"]
+
+
+@mcp.tool()
+async def file_content(owner: str, repo: str, path: str) -> str:
+    """
+    Get the decoded content of a file in a repository.
+
+    Args:
+        owner: The repository owner (user or organization)
+        repo: The repository name
+        path: Path of the file inside the repository
+    """
+    content = await _run_blocking(get_github().get_file_content, owner, repo, path)
+    return content if content is not None else f"File not found: {path}"
+
+
+@mcp.tool()
+async def analyze_repo(owner: str, repo: str) -> dict:
+    """
+    Run the full RepoAnalyzer analysis (tech stack, architecture, code, business).
+
+    Args:
+        owner: The repository owner (user or organization)
+        repo: The repository name
+    """
+    github = get_github()
+
+    def run():
+        analyzer = RepoAnalyzer(github, verbose=False)
+        analysis = analyzer.analyze(owner, repo)
+        return {
+            "summary": analyzer.format_summary(),
+            "languages": analysis.get("languages", {}),
+            "business": analysis.get("business", {}),
+            "file_counts": analysis.get("code_analysis", {}).get("file_counts", {}),
+        }
+
+    return await _run_blocking(run)
+
+
+@mcp.tool()
+async def cache_stats() -> dict:
+    """Report cache hit/miss counters and in-memory cache size for the shared GitHub client."""
+    github = get_github()
+    return dict(github.stats, **github.memory_usage())
+
+
+def main():
+    """Main entry point."""
+    print("🚀 GitHub repos MCP server running on stdio", file=sys.stderr)
+    mcp.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Fetches LinkedIn profile data and generates/updates a professional resume.
 """
 
 import os
+import sys
 import json
 from datetime import datetime
 from dotenv import load_dotenv
@@ -12,6 +13,10 @@ from openai import OpenAI
 # Load environment variables
 load_dotenv(os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env"))
 
+# Shared pooled HTTP client lives in ../common
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.http_client import get_http_client
+
 
 class LinkedInClient:
     """Client for fetching LinkedIn profile data."""
@@ -239,11 +244,15 @@ class ManualProfileInput:
 class ResumeGenerator:
     """Generates and formats resumes from profile data."""
     
-    def __init__(self, openai_api_key=None):
+    def __init__(self, openai_api_key=None, base_url=None):
         self.openai_key = openai_api_key or os.getenv("OPENAI_API_KEY")
+        # base_url falls back to OPENAI_BASE_URL, e.g. to target a local mock server
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL")
         self.client = None
         if self.openai_key:
-            self.client = OpenAI(api_key=self.openai_key)
+            # Reuse the process-wide connection pool instead of one per generator
+            self.client = OpenAI(api_key=self.openai_key, base_url=self.base_url,
+                                 http_client=get_http_client("openai"))
     
     def enhance_with_ai(self, text, context="resume bullet point"):
         """Use AI to enhance text for resume."""
@@ -0,0 +1,187 @@
+"""
+Agent Load Test
+Drives the resume agent and the repo summary agent against the mock LLM server
+at increasing concurrency and reports throughput, tail latency and retries.
+
+Usage:
+    # Start a mock server in-process and test both agents
+    python load_test.py --concurrency 1 2 4 8 16 --requests 32 --rate-limit-rate 0.05
+
+    # Or point at an already running mock_llm_server.py
+    python load_test.py --base-url http://127.0.0.1:8765 --agent resume
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import importlib.util
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from mock_llm_server import start_in_background, add_config_arguments, config_from_args
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MOCK_MODEL_ID = "Qwen/Qwen2.5-Coder-32B-Instruct"
+
+SAMPLE_JOB_DESCRIPTION = (
+    "Worked on the backend team. Built APIs for the mobile app and helped move services to the cloud.\n"
+    "Fixed production issues and mentored two junior developers."
+)
+
+
+def load_agent_module(project_dir, module_name):
+    """Import a project's main.py under a unique module name."""
+    path = os.path.join(REPO_ROOT, project_dir, "main.py")
+    sys.path.insert(0, os.path.dirname(path))
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ResumeAgentTask:
+    """One AI enhancement call through ResumeGenerator (OpenAI chat completions API)."""
+
+    name = "resume"
+
+    def __init__(self, base_url):
+        resume_agent = load_agent_module("4-linkedin-updater", "resume_agent")
+        # One generator per run so all workers share the OpenAI client's connection pool
+        self.generator = resume_agent.ResumeGenerator(openai_api_key="mock-key", base_url=f"{base_url}/v1")
+
+    def __call__(self):
+        result = self.generator.enhance_with_ai(SAMPLE_JOB_DESCRIPTION, "job description")
+        # enhance_with_ai returns its input unchanged when the API call fails
+        return result != SAMPLE_JOB_DESCRIPTION
+
+
+class RepoAgentTask:
+    """One CodeAgent run through HfApiModel (HF inference chat completions API)."""
+
+    name = "repo"
+
+    def __init__(self, base_url):
+        self.repo_agent = load_agent_module("2-mygitrepos-summary", "repo_agent")
+        self.model_id = f"{base_url}/models/{MOCK_MODEL_ID}"
+
+    def __call__(self):
+        # CodeAgent keeps per-run memory, so each task gets its own agent
+        agent = self.repo_agent.build_agent(self.model_id, "mock-token")
+        result = agent.run("Fetch all repositories for GitHub user 'octocat' and summarize them.")
+        return bool(result)
+
+
+def fetch_stats(base_url, reset=False):
+    """Read (or reset) the mock server counters."""
+    if reset:
+        req = urllib.request.Request(f"{base_url}/stats/reset", data=b"{}", method="POST")
+    else:
+        req = urllib.request.Request(f"{base_url}/stats")
+    with urllib.request.urlopen(req) as resp:
+        return json.loads(resp.read())
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[k]
+
+
+def timed(task):
+    start = time.perf_counter()
+    try:
+        ok = task()
+    except Exception:
+        ok = False
+    return ok, (time.perf_counter() - start) * 1000
+
+
+def run_level(task, base_url, concurrency, num_requests):
+    """Run num_requests tasks with the given concurrency and collect metrics."""
+    fetch_stats(base_url, reset=True)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda _: timed(task), range(num_requests)))
+    wall = time.perf_counter() - start
+    server = fetch_stats(base_url)
+
+    latencies = [ms for ok, ms in results if ok]
+    failed = sum(1 for ok, _ in results if not ok)
+    bad_responses = server["rate_limited"] + server["errors"]
+    return {
+        "concurrency": concurrency,
+        "ok": len(latencies),
+        "failed": failed,
+        "throughput": len(latencies) / wall if wall else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "llm_calls": server["requests"],
+        "rate_limited": server["rate_limited"],
+        "errors": server["errors"],
+        # every 429/5xx is either retried by the client or ends a failed task
+        "retries": max(0, bad_responses - failed),
+        "peak_inflight": server["inflight_peak"],
+    }
+
+
+def print_report(agent_name, rows):
+    print(f"\n📈 {agent_name} agent")
+    header = (f"{'conc':>5} {'ok':>5} {'fail':>5} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+              f"{'calls':>6} {'429':>5} {'5xx':>5} {'retry':>6} {'peak':>5}")
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        print(f"{r['concurrency']:>5} {r['ok']:>5} {r['failed']:>5} {r['throughput']:>8.2f} {r['p50']:>9.0f} "
+              f"{r['p95']:>9.0f} {r['p99']:>9.0f} {r['llm_calls']:>6} {r['rate_limited']:>5} {r['errors']:>5} "
+              f"{r['retries']:>6} {r['peak_inflight']:>5}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Load test the agents against the mock LLM server")
+    parser.add_argument("--base-url", help="use a running mock server instead of starting one in-process")
+    parser.add_argument("--agent", choices=["resume", "repo", "both"], default="both")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--requests", type=int, default=32, help="agent invocations per concurrency level")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    # The agents' shared HTTP client caps in-flight requests per host (common/http_client.py);
+    # lift the cap so every level reaches the server at its full concurrency
+    os.environ.setdefault("HTTP_PER_HOST_LIMIT", str(max(args.concurrency)))
+
+    base_url = args.base_url
+    if not base_url:
+        server = start_in_background(config_from_args(args))
+        base_url = server.base_url
+        print(f"🤖 Started mock LLM server on {base_url}")
+
+    task_types = {"resume": [ResumeAgentTask], "repo": [RepoAgentTask],
+                  "both": [ResumeAgentTask, RepoAgentTask]}[args.agent]
+
+    report = {}
+    for task_type in task_types:
+        task = task_type(base_url)
+        rows = []
+        for concurrency in args.concurrency:
+            print(f"   {task.name}: concurrency {concurrency}...", flush=True)
+            rows.append(run_level(task, base_url, concurrency, args.requests))
+        print_report(task.name, rows)
+        report[task.name] = rows
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✅ Results saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
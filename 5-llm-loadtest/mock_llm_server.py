@@ -0,0 +1,389 @@
+"""
+Mock LLM Server
+Local stand-in for the OpenAI chat-completions API and the Hugging Face inference API.
+
+Endpoints:
+  POST /v1/chat/completions                  OpenAI chat completions (stream or not)
+  POST /models/<model_id>/v1/chat/completions HF inference chat completions (used by HfApiModel)
+  POST /models/<model_id>                    HF text-generation (stream or not)
+  GET  /stats                                Request counters
+  POST /stats/reset                          Reset the counters
+
+Latency, throughput, errors and 429s are configurable so agent performance
+changes can be measured without paid, rate-limited remote calls.
+
+Usage:
+    python mock_llm_server.py --port 8765 --latency-ms 400 --tokens-per-sec 60 --rate-limit-rate 0.05
+"""
+
+import json
+import time
+import uuid
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FILLER_WORDS = (
+    "delivered scalable results by leading cross-functional teams to design build and ship "
+    "reliable services that improved performance reduced costs and increased customer satisfaction"
+).split()
+
+# CodeAgent prompts mention final_answer; answering with it ends the run in one step
+CODE_AGENT_REPLY = (
+    "Thought: I have everything I need, so I will return the summary directly.\n"
+    "Code:\n```py\nfinal_answer(\"Mock summary of the requested repositories.\")\n```<end_code>"
+)
+
+
+class MockConfig:
+    """Behaviour knobs for the mock server."""
+
+    def __init__(self, latency_dist="lognormal", latency_ms=300.0, latency_jitter=0.5,
+                 tokens_per_sec=50.0, completion_tokens=120, error_rate=0.0,
+                 rate_limit_rate=0.0, max_concurrency=0, retry_after=1.0, seed=None):
+        self.latency_dist = latency_dist
+        self.latency_ms = latency_ms
+        self.latency_jitter = latency_jitter
+        self.tokens_per_sec = tokens_per_sec
+        self.completion_tokens = completion_tokens
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.max_concurrency = max_concurrency
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+
+    def time_to_first_token(self):
+        """Sample a time-to-first-token in seconds from the configured distribution."""
+        with self.random_lock:
+            if self.latency_dist == "constant":
+                ms = self.latency_ms
+            elif self.latency_dist == "uniform":
+                spread = self.latency_ms * self.latency_jitter
+                ms = self.random.uniform(self.latency_ms - spread, self.latency_ms + spread)
+            elif self.latency_dist == "exponential":
+                ms = self.random.expovariate(1.0 / self.latency_ms) if self.latency_ms else 0.0
+            else:
+                # lognormal with the configured median; jitter is sigma
+                ms = self.latency_ms * self.random.lognormvariate(0.0, self.latency_jitter)
+        return max(0.0, ms) / 1000.0
+
+    def roll(self, rate):
+        with self.random_lock:
+            return self.random.random() < rate
+
+
+class Stats:
+    """Thread-safe request counters exposed at /stats."""
+
+    FIELDS = ("requests", "ok", "rate_limited", "errors", "streamed", "completion_tokens")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.counts = dict.fromkeys(self.FIELDS, 0)
+            self.inflight = 0
+            self.inflight_peak = 0
+
+    def incr(self, field, amount=1):
+        with self.lock:
+            self.counts[field] += amount
+
+    def enter(self):
+        with self.lock:
+            self.inflight += 1
+            self.inflight_peak = max(self.inflight_peak, self.inflight)
+            return self.inflight
+
+    def leave(self):
+        with self.lock:
+            self.inflight -= 1
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counts, inflight=self.inflight, inflight_peak=self.inflight_peak)
+
+
+def estimate_tokens(text):
+    """Rough token count (~0.75 words per token) for usage reporting."""
+    return max(1, int(len(text.split()) / 0.75))
+
+
+def build_completion_text(prompt_text, max_tokens, config):
+    """Pick the reply: a final_answer step for CodeAgent prompts, filler text otherwise."""
+    if "final_answer" in prompt_text:
+        return CODE_AGENT_REPLY
+    n = min(max_tokens or config.completion_tokens, config.completion_tokens)
+    return " ".join(FILLER_WORDS[i % len(FILLER_WORDS)] for i in range(n)).capitalize() + "."
+
+
+def split_chunks(text):
+    """Split text into roughly one-token stream chunks (words with their leading space)."""
+    words = text.split(" ")
+    return [words[0]] + [" " + w for w in words[1:]]
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    """Request handler; config and stats live on the server instance."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # ------------------------------------------------------------------
+    # Plumbing
+    # ------------------------------------------------------------------
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _start_stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+    def _send_event(self, payload):
+        data = payload if isinstance(payload, str) else json.dumps(payload)
+        self.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length) if length else b"{}"
+        try:
+            return json.loads(raw or b"{}")
+        except ValueError:
+            return {}
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            self._send_json(200, self.server.stats.snapshot())
+        elif self.path.rstrip("/") in ("", "/health"):
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        path = self.path.split("?")[0].rstrip("/")
+        request = self._read_json()
+
+        if path == "/stats/reset":
+            self.server.stats.reset()
+            self._send_json(200, {"status": "reset"})
+            return
+
+        if path.endswith("/v1/chat/completions"):
+            model = request.get("model") or path[len("/models/"):-len("/v1/chat/completions")] or "mock"
+            self._handle_llm(request, model, self._chat_completion)
+        elif path.startswith("/models/"):
+            self._handle_llm(request, path[len("/models/"):], self._text_generation)
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def _handle_llm(self, request, model, respond):
+        """Apply failure injection and latency, then hand off to the endpoint responder."""
+        config, stats = self.server.config, self.server.stats
+        stats.incr("requests")
+        inflight = stats.enter()
+        try:
+            over_capacity = config.max_concurrency and inflight > config.max_concurrency
+            if over_capacity or config.roll(config.rate_limit_rate):
+                stats.incr("rate_limited")
+                self._send_json(429, {"error": {"message": "Rate limit reached (mock)", "type": "rate_limit_error"}},
+                                headers={"Retry-After": f"{config.retry_after:g}"})
+                return
+
+            time.sleep(config.time_to_first_token())
+
+            if config.roll(config.error_rate):
+                stats.incr("errors")
+                self._send_json(500, {"error": {"message": "Internal server error (mock)", "type": "server_error"}})
+                return
+
+            respond(request, model)
+            stats.incr("ok")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            stats.leave()
+
+    # ------------------------------------------------------------------
+    # Responders
+    # ------------------------------------------------------------------
+
+    def _emit_tokens(self, chunks, make_event):
+        """Stream chunks at the configured tokens/sec."""
+        delay = 1.0 / self.server.config.tokens_per_sec if self.server.config.tokens_per_sec > 0 else 0.0
+        for i, chunk in enumerate(chunks):
+            if delay:
+                time.sleep(delay)
+            self._send_event(make_event(i, chunk))
+
+    def _generation_time(self, n_tokens):
+        tps = self.server.config.tokens_per_sec
+        return n_tokens / tps if tps > 0 else 0.0
+
+    def _chat_completion(self, request, model):
+        messages = request.get("messages", [])
+        prompt_text = "\n".join(
+            m["content"] if isinstance(m.get("content"), str)
+            else " ".join(part.get("text", "") for part in m.get("content") or [])
+            for m in messages
+        )
+        text = build_completion_text(prompt_text, request.get("max_tokens"), self.server.config)
+        chunks = split_chunks(text)
+        usage = {"prompt_tokens": estimate_tokens(prompt_text), "completion_tokens": len(chunks),
+                 "total_tokens": estimate_tokens(prompt_text) + len(chunks)}
+        self.server.stats.incr("completion_tokens", len(chunks))
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+
+        if not request.get("stream"):
+            time.sleep(self._generation_time(len(chunks)))
+            self._send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": text},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage,
+            })
+            return
+
+        self.server.stats.incr("streamed")
+        self._start_stream()
+
+        def make_event(i, chunk):
+            delta = {"role": "assistant", "content": chunk} if i == 0 else {"content": chunk}
+            return {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+
+        self._emit_tokens(chunks, make_event)
+        final = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                 "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        if (request.get("stream_options") or {}).get("include_usage"):
+            final["usage"] = usage
+        self._send_event(final)
+        self._send_event("[DONE]")
+
+    def _text_generation(self, request, model):
+        prompt_text = request.get("inputs", "")
+        params = request.get("parameters") or {}
+        text = build_completion_text(prompt_text, params.get("max_new_tokens"), self.server.config)
+        chunks = split_chunks(text)
+        self.server.stats.incr("completion_tokens", len(chunks))
+
+        if not request.get("stream"):
+            time.sleep(self._generation_time(len(chunks)))
+            self._send_json(200, [{"generated_text": text}])
+            return
+
+        self.server.stats.incr("streamed")
+        self._start_stream()
+
+        def make_event(i, chunk):
+            last = i == len(chunks) - 1
+            return {"index": i + 1, "token": {"id": i, "text": chunk, "logprob": 0.0, "special": False},
+                    "generated_text": text if last else None,
+                    "details": {"finish_reason": "eos_token", "generated_tokens": len(chunks)} if last else None}
+
+        self._emit_tokens(chunks, make_event)
+
+
+class MockLLMServer(ThreadingHTTPServer):
+    """Threaded HTTP server carrying the mock config and stats."""
+
+    daemon_threads = True
+
+    def __init__(self, address, config, verbose=False):
+        super().__init__(address, MockLLMHandler)
+        self.config = config
+        self.stats = Stats()
+        self.verbose = verbose
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_in_background(config=None, host="127.0.0.1", port=0):
+    """Start a mock server on a daemon thread and return it (port 0 picks a free port)."""
+    server = MockLLMServer((host, port), config or MockConfig())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_config_arguments(parser):
+    """Register MockConfig options on an argparse parser."""
+    parser.add_argument("--latency-dist", default="lognormal",
+                        choices=["constant", "uniform", "lognormal", "exponential"],
+                        help="distribution of time to first token")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="median/mean time to first token")
+    parser.add_argument("--latency-jitter", type=float, default=0.5,
+                        help="lognormal sigma, or +/- fraction of latency-ms for uniform")
+    parser.add_argument("--tokens-per-sec", type=float, default=50.0, help="generation speed (0 = instant)")
+    parser.add_argument("--completion-tokens", type=int, default=120, help="max tokens in each completion")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--max-concurrency", type=int, default=0,
+                        help="answer 429 when more requests than this are in flight (0 = unlimited)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for reproducible runs")
+
+
+def config_from_args(args):
+    return MockConfig(
+        latency_dist=args.latency_dist, latency_ms=args.latency_ms, latency_jitter=args.latency_jitter,
+        tokens_per_sec=args.tokens_per_sec, completion_tokens=args.completion_tokens,
+        error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+        max_concurrency=args.max_concurrency, retry_after=args.retry_after, seed=args.seed,
+    )
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Mock OpenAI / Hugging Face inference server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockLLMServer((args.host, args.port), config_from_args(args), verbose=args.verbose)
+    print(f"🤖 Mock LLM server listening on {server.base_url}")
+    print(f"   OpenAI:  OPENAI_BASE_URL={server.base_url}/v1")
+    print(f"   HF:      HF_MODEL_ID={server.base_url}/models/Qwen/Qwen2.5-Coder-32B-Instruct")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Shared HTTP Client
+Pooled, keep-alive HTTP client used by every agent in this repository.
+
+- One connection pool per named client, reused for the life of the process
+  (and recreated after a fork, so worker processes never share sockets)
+- HTTP/2 when the ``h2`` package is installed
+- gzip/deflate decoding, plus brotli when ``brotli`` is installed
+- Connect/read/write/pool timeouts
+- A per-host limit on concurrent requests, shared by all clients in the process
+- Timing hooks called once per request with its latency breakdown
+
+Settings can be overridden with HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT,
+HTTP_MAX_CONNECTIONS and HTTP_PER_HOST_LIMIT. They are read when a client or
+host limit is first created, so values loaded from .env after import apply.
+
+Usage:
+    from common.http_client import get_http_client, github_client, add_timing_hook
+
+    response = github_client().get("/users/octocat/repos")
+"""
+
+import os
+import time
+import threading
+import importlib.util
+import httpx
+
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 30
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_PER_HOST_LIMIT = 8
+
+USER_AGENT = "tenkara-ai-agents"
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+BROTLI_AVAILABLE = any(importlib.util.find_spec(m) is not None for m in ("brotli", "brotlicffi"))
+
+_lock = threading.Lock()
+_pid = None
+_clients = {}
+_host_semaphores = {}
+_timing_hooks = []
+
+
+def add_timing_hook(hook):
+    """
+    Register a callable that receives a timing dict after every request.
+
+    The dict has method, url, host, status, http_version, ttfb_ms (time to
+    response headers), elapsed_ms (until the body is read) and bytes.
+    """
+    _timing_hooks.append(hook)
+
+
+def remove_timing_hook(hook):
+    if hook in _timing_hooks:
+        _timing_hooks.remove(hook)
+
+
+def default_timeout():
+    """Connect/read/write/pool timeouts from HTTP_CONNECT_TIMEOUT and HTTP_READ_TIMEOUT."""
+    connect = float(os.getenv("HTTP_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT))
+    read = float(os.getenv("HTTP_READ_TIMEOUT", DEFAULT_READ_TIMEOUT))
+    return httpx.Timeout(connect=connect, read=read, write=read, pool=read)
+
+
+def _reset_after_fork():
+    """Drop clients inherited from a parent process; their sockets are not ours."""
+    global _pid
+    if _pid != os.getpid():
+        _clients.clear()
+        _host_semaphores.clear()
+        _pid = os.getpid()
+
+
+def _host_semaphore(host):
+    with _lock:
+        if host not in _host_semaphores:
+            limit = int(os.getenv("HTTP_PER_HOST_LIMIT", DEFAULT_PER_HOST_LIMIT))
+            _host_semaphores[host] = threading.BoundedSemaphore(limit)
+        return _host_semaphores[host]
+
+
+class _TimedStream(httpx.SyncByteStream):
+    """Response body wrapper that frees the host slot and reports timing on close."""
+
+    def __init__(self, stream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+        self._bytes = 0
+        self._closed = False
+
+    def __iter__(self):
+        for chunk in self._stream:
+            self._bytes += len(chunk)
+            yield chunk
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._stream.close()
+        finally:
+            self._on_close(self._bytes)
+
+
+class _PerHostTransport(httpx.BaseTransport):
+    """Transport wrapper adding the per-host concurrency limit and timing hooks."""
+
+    def __init__(self, transport):
+        self._transport = transport
+
+    def handle_request(self, request):
+        semaphore = _host_semaphore(request.url.host)
+        # Waiting for a host slot counts against the pool timeout, so a response
+        # that is never closed cannot block later requests forever
+        pool_timeout = request.extensions.get("timeout", {}).get("pool")
+        if not semaphore.acquire(timeout=pool_timeout):
+            raise httpx.PoolTimeout(f"Timed out waiting for a free slot to {request.url.host}", request=request)
+        start = time.perf_counter()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        ttfb_ms = (time.perf_counter() - start) * 1000
+
+        def on_close(num_bytes):
+            semaphore.release()
+            if not _timing_hooks:
+                return
+            timing = {
+                "method": request.method,
+                "url": str(request.url),
+                "host": request.url.host,
+                "status": response.status_code,
+                "http_version": response.extensions.get("http_version", b"HTTP/1.1").decode("ascii"),
+                "ttfb_ms": ttfb_ms,
+                "elapsed_ms": (time.perf_counter() - start) * 1000,
+                "bytes": num_bytes,
+            }
+            for hook in list(_timing_hooks):
+                try:
+                    hook(timing)
+                except Exception:
+                    pass
+
+        response.stream = _TimedStream(response.stream, on_close)
+        return response
+
+    def close(self):
+        self._transport.close()
+
+
+def get_http_client(name="default", base_url="", headers=None, timeout=None):
+    """
+    Return the process-wide ``httpx.Client`` registered under ``name``.
+
+    The first call for a name creates the client with the given base URL,
+    default headers and timeout (``default_timeout()`` if None); later calls
+    return the same instance so its connection pool stays warm.
+    """
+    with _lock:
+        _reset_after_fork()
+        client = _clients.get(name)
+        if client is None:
+            max_connections = int(os.getenv("HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS))
+            transport = httpx.HTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections,
+                                    keepalive_expiry=60),
+                retries=1,
+            )
+            client = httpx.Client(
+                base_url=base_url,
+                headers={"User-Agent": USER_AGENT, **(headers or {})},
+                timeout=timeout or default_timeout(),
+                transport=_PerHostTransport(transport),
+                follow_redirects=True,
+            )
+            _clients[name] = client
+        return client
+
+
+def github_client():
+    """Shared client for api.github.com with auth headers built once from GITHUB_TOKEN/GH_TOKEN."""
+    with _lock:
+        _reset_after_fork()
+        client = _clients.get("github")
+    if client is not None:
+        return client
+
+    headers = {
+        "Accept": "application/vnd.github.v3+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    token = os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return get_http_client("github", base_url="https://api.github.com", headers=headers)
+
+
+def close_all():
+    """Close every shared client (mainly for tests and short-lived scripts)."""
+    with _lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()